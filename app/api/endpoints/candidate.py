@@ -54,7 +54,8 @@ async def create_candidate(
 
         try:
             db.commit()
-            db.refresh(db_candidate)
+            # resume_summary is deferred, so ask for every column to keep it in the response
+            db.refresh(db_candidate, attribute_names=[c.key for c in Candidate.__table__.columns])
         except Exception as e:
             db.rollback()
 
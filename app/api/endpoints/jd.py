@@ -1,9 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from app.api.dependencies import get_llm_service, get_db_session
+from app.core.database import sessionLocal
 from app.services.llm_service import LLMService
 from app.models.interview_models import JobDescription, JobDescriptionCreate
 from uuid import uuid4
+import json
+
 router = APIRouter(prefix='/jd', tags=['Job Description'])
 
 @router.post("/generate-questions", status_code=status.HTTP_201_CREATED)
@@ -24,11 +28,47 @@ def generate_questions(
         db.add(db_jd)
         db.commit()
         db.refresh(db_jd)
-        return {"jd_id": db_jd.id, "questions": db_jd.generated_questions}
+        return {"jd_id": db_jd.id, "questions": questions}
     except Exception as e:
         print(f"Error occured while generating questions: ")
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, 
             detail=f"AI Question generation failed: {e}"
         )
-    
+
+def format_sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@router.post("/generate-questions/stream")
+def stream_generate_questions(
+    jd_in: JobDescriptionCreate,
+    llm_service: LLMService = Depends(get_llm_service)
+):
+    """
+    Server-Sent Events variant of /generate-questions. Emits a `question` event per
+    question as soon as it's generated, then persists the JD and emits `done`.
+    """
+    def event_stream():
+        questions = []
+        try:
+            for question in llm_service.stream_interview_questions(jd_text=jd_in.content):
+                yield format_sse("question", {"index": len(questions), "question": question})
+                questions.append(question)
+
+            # The request-scoped session may already be closed once the body streams,
+            # so the final save uses its own short-lived one
+            jd_id = str(uuid4())
+            with sessionLocal() as db:
+                db.add(JobDescription(
+                    id=jd_id,
+                    title=jd_in.title,
+                    content=jd_in.content,
+                    generated_questions=questions
+                ))
+                db.commit()
+            yield format_sse("done", {"jd_id": jd_id, "questions": questions})
+        except Exception as e:
+            print(f"Error occured while streaming questions: {e}")
+            yield format_sse("error", {"detail": f"AI Question generation failed: {e}"})
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, Form
 from fastapi.responses import Response
-from sqlalchemy.orm import Session
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session, joinedload, load_only, undefer
 from twilio.twiml.voice_response import VoiceResponse
 from app.api.dependencies import get_db_session, get_llm_service
-from app.models.interview_models import Candidate, InterviewResult
+from app.models.interview_models import Candidate, InterviewResult, JobDescription
 from app.services.llm_service import LLMService
 from uuid import UUID
 import json
@@ -16,17 +17,37 @@ router = APIRouter(prefix="/twilio/interview", tags=["Twilio Webhooks"])
 def get_twiml_response(response: VoiceResponse) -> Response:
     return Response(content=str(response), media_type="application/xml")
 
+def get_question_slot(db: Session, candidate_id: UUID, question_index: int = 0):
+    """
+    Projects the question count and a single question for a candidate's JD, so the
+    call flow never loads the full question list, JD content or resume.
+    Returns None if the candidate doesn't exist, otherwise (total, question).
+    """
+    questions = JobDescription.generated_questions
+    # generated_questions=None is stored as JSON null, and json_array_length raises on scalars
+    total = case(
+        (func.json_typeof(questions) == "array", func.json_array_length(questions)),
+        else_=0,
+    )
+    return (
+        db.query(total, questions[question_index].as_string())
+        .select_from(Candidate)
+        .outerjoin(Candidate.jd)
+        .filter(Candidate.id == candidate_id)
+        .first()
+    )
+
 @router.post("/start/{candidate_id}")
 def start_interview(
     candidate_id: UUID, 
     db: Session = Depends(get_db_session)
 ):
-    candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
-    if not candidate:
+    slot = get_question_slot(db, candidate_id)
+    if not slot:
         return get_twiml_response(VoiceResponse().say("Error: Candidate record not found. Goodbye."))
 
-    questions = candidate.jd.generated_questions
-    if not questions:
+    total_questions, _ = slot
+    if not total_questions:
         return get_twiml_response(VoiceResponse().say("Error: No questions found for this interview. Goodbye."))
 
     response = VoiceResponse()
@@ -44,18 +65,18 @@ def handle_question(
     question_index: int,
     db: Session = Depends(get_db_session)
 ):
-    candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
-    questions = candidate.jd.generated_questions
-    total_questions = len(questions)
+    slot = get_question_slot(db, candidate_id, question_index)
+    if not slot:
+        return get_twiml_response(VoiceResponse().say("Error: Candidate record not found. Goodbye."))
+
+    total_questions, current_question = slot
 
-    if question_index >= total_questions:
+    if question_index >= (total_questions or 0):
         response = VoiceResponse()
         response.say("Thank you for completing the interview. Goodbye!")
         response.redirect(url=f"/twilio/interview/finish/{candidate_id}", method='POST')
         return get_twiml_response(response)
 
-    current_question = questions[question_index]
-    
     response = VoiceResponse()
     response.say(f"Question number {question_index + 1}: {current_question}")
     
@@ -87,14 +108,14 @@ def advance_call(
     db: Session = Depends(get_db_session)
 ):
     
-    candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
-    if not candidate:
+    slot = get_question_slot(db, candidate_id)
+    if not slot:
         print(f"Candidate with {candidate_id} not found")
         return get_twiml_response(VoiceResponse().say("An error occured during call advancement"))
 
     response = VoiceResponse()
-    total = len(candidate.jd.generated_questions)
-    if next_question < total:
+    total, _ = slot
+    if next_question < (total or 0):
         redirect_url = f"/twilio/interview/question/{candidate_id}/{next_question}"
     else:
         redirect_url = f"/twilio/interview/finish/{candidate_id}"
@@ -113,13 +134,19 @@ async def record_callback(
     db: Session = Depends(get_db_session)
 ):
     
-    result_record = db.query(InterviewResult).filter(InterviewResult.candidate_id == candidate_id).first()
+    result_record = (
+        db.query(InterviewResult)
+        .options(load_only(InterviewResult.id, InterviewResult.interview_data))
+        .filter(InterviewResult.candidate_id == candidate_id)
+        .first()
+    )
+    slot = get_question_slot(db, candidate_id, question_index)
 
-    if not result_record or not result_record.candidates.jd.generated_questions:
+    if not result_record or not slot or not slot[0]:
         print(f"Error: Result record or questions not found for candidate {candidate_id}")
         return Response(status_code=200)
 
-    current_question = result_record.candidates.jd.generated_questions[question_index]
+    _, current_question = slot
 
     new_qa_entry = {
         "question_index": question_index,
@@ -147,7 +174,19 @@ async def finish_interview(
     llm_service: LLMService = llm_service_dep,
     db: Session = Depends(get_db_session)
 ):
-    result_record = db.query(InterviewResult).filter(InterviewResult.candidate_id == candidate_id).first()
+    # Scoring is the one webhook that needs the heavy columns, so pull them in a single query
+    result_record = (
+        db.query(InterviewResult)
+        .options(
+            undefer(InterviewResult.interview_data),
+            joinedload(InterviewResult.candidates).options(
+                undefer(Candidate.resume_summary),
+                joinedload(Candidate.jd).undefer(JobDescription.content),
+            ),
+        )
+        .filter(InterviewResult.candidate_id == candidate_id)
+        .first()
+    )
     
     if not result_record:
         return Response(status_code=200)
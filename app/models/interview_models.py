@@ -2,17 +2,19 @@ from typing import List, Optional, Dict, Annotated
 from uuid import UUID
 from sqlalchemy import Column, Integer, String, JSON, ForeignKey, UUID
 from sqlalchemy.ext.mutable import MutableList
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from pydantic import BaseModel, EmailStr, field_validator, ConfigDict, TypeAdapter
 from app.core.database import Base
 
 # schema models
+# Large text/JSON columns are deferred so webhook lookups don't pull them on every
+# row load; paths that need them (scoring, export) opt in with undefer().
 class JobDescription(Base):
     __tablename__ = "job_descriptions"
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=UUID)
     title = Column(String, index=True)
-    content = Column(String)
-    generated_questions = Column(JSON)
+    content = deferred(Column(String))
+    generated_questions = deferred(Column(JSON))
     candidates = relationship("Candidate", back_populates='jd')
 
 class Candidate(Base):
@@ -20,7 +22,7 @@ class Candidate(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=UUID)
     name = Column(String, index=True,)
     e164_phone = Column(String, unique=True)
-    resume_summary = Column(JSON)
+    resume_summary = deferred(Column(JSON))
     jd_id = Column(UUID(as_uuid=True), ForeignKey("job_descriptions.id"))
     jd = relationship("JobDescription", back_populates="candidates")
     results = relationship("InterviewResult", back_populates="candidates")
@@ -30,7 +32,7 @@ class InterviewResult(Base):
     id = Column(UUID(as_uuid=True), primary_key=True, index=True, default=UUID)
     candidate_id = Column(UUID(as_uuid=True), ForeignKey("candidates.id"), unique=True, index=True, nullable=False)
     call_sid = Column(String, unique=True, index=True)
-    interview_data = Column(MutableList.as_mutable(JSON), default=[], nullable=False) 
+    interview_data = deferred(Column(MutableList.as_mutable(JSON), default=[], nullable=False))
     final_score = Column(Integer, nullable=True)
     final_recommendation = Column(String, nullable=True)
     candidates = relationship("Candidate", back_populates="results")
@@ -1,11 +1,18 @@
 import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator
 from google import genai
 from google.genai import types
 from google.genai.errors import APIError
 from app.core.config import settings
 import re
 
+QUESTIONS_SYSTEM_PROMPT = """
+You are an expert technical interviewer. Your task is to analyze the provided 
+Job Description (JD) and generate exactly 7 concise, challenging, and relevant 
+interview questions. The output MUST be a JSON object with a single key 'questions' 
+containing a list of the 7 generated questions.
+"""
+
 class LLMService:
 
     def __init__(self, api_key: str, model_name: str):
@@ -40,17 +47,51 @@ class LLMService:
             print(f"Gemini API or json decode error: {e}")
             raise RuntimeError(f"Failed to get structured JSON from LLM: {e}")
     
+    def _iter_json_string_list(self, chunks: Iterable[str], key: str) -> Iterator[str]:
+        """
+        Incrementally decodes the string list stored under `key` in a streamed JSON
+        object, yielding each element as soon as it is complete. Once the stream ends
+        the whole document is validated, so truncated or malformed output raises.
+        """
+        decoder = json.JSONDecoder()
+        array_start = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+        buffer = ""
+        pos = None
+        items = []
+        for chunk in chunks:
+            buffer += chunk
+            if pos is None:
+                match = array_start.search(buffer)
+                if not match:
+                    continue
+                pos = match.end()
+            while True:
+                while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                    pos += 1
+                if pos >= len(buffer) or buffer[pos] == "]":
+                    break
+                try:
+                    item, pos = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    # element not fully received yet
+                    break
+                if not isinstance(item, str):
+                    raise RuntimeError(f"Expected '{key}' to contain only strings, got: {item!r}")
+                items.append(item)
+                yield item
+
+        try:
+            document = json.loads(self._clean_json_text(buffer))
+        except json.JSONDecodeError as e:
+            raise RuntimeError(f"Incomplete or invalid JSON streamed from LLM: {e}")
+        if not isinstance(document, dict) or document.get(key) != items:
+            raise RuntimeError(f"Streamed JSON has no valid '{key}' list")
+
     def generate_interview_questions(self, jd_text: str) -> List[str]:
         
-        system_prompt = """
-You are an expert technical interviewer. Your task is to analyze the provided 
-Job Description (JD) and generate exactly 7 concise, challenging, and relevant 
-interview questions. The output MUST be a JSON object with a single key 'questions' 
-containing a list of the 7 generated questions.
-"""
         user_prompt = f"Job Description to analyze:\n---\n{jd_text}"
         
-        json_response = self._generate_structure_output(system_prompt=system_prompt, user_prompt=user_prompt)
+        json_response = self._generate_structure_output(system_prompt=QUESTIONS_SYSTEM_PROMPT, user_prompt=user_prompt)
 
         questions = json_response.get("questions", [])
         if not (5 <= len(questions) <= 7):
@@ -58,6 +99,35 @@ containing a list of the 7 generated questions.
         
         return [q.strip() for q in questions]
 
+    def stream_interview_questions(self, jd_text: str) -> Iterator[str]:
+        """
+        Streaming variant of generate_interview_questions, yields each question
+        as soon as the model has finished writing it.
+        """
+        user_prompt = f"Job Description to analyze:\n---\n{jd_text}"
+
+        try:
+            stream = self.client.models.generate_content_stream(
+                model=self.model,
+                contents=[user_prompt],
+                config=types.GenerateContentConfig(
+                    system_instruction=QUESTIONS_SYSTEM_PROMPT,
+                    response_mime_type='application/json'
+                )
+            )
+            count = 0
+            for question in self._iter_json_string_list((chunk.text or "" for chunk in stream), "questions"):
+                count += 1
+                yield question.strip()
+        except (APIError, AttributeError) as e:
+            print(f"Gemini API streaming error: {e}")
+            raise RuntimeError(f"Failed to stream questions from LLM: {e}")
+
+        if not count:
+            raise RuntimeError("LLM returned no questions")
+        if not (5 <= count <= 7):
+            print(f"LLM returned {count} questions. Expected 5-7")
+
     def parse_resume_data(self, resume_text: str) -> Dict[str, Any]:
         
         system_prompt = """